@@ -11,11 +11,41 @@ Data covers:
 - Performance metrics: IAS (mph), Rate of Climb (fpm), Fuel to altitude (gal)
 """
 
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import math
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional - run the kernels as plain Python instead
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+class PerfTuple(NamedTuple):
+    """Lightweight record of aircraft performance at specific conditions (same fields as PerformanceData)"""
+    ias_mph: float
+    roc_fpm: float
+    fuel_gal: float
+    pressure_altitude_ft: float
+    density_altitude_ft: float
+    temperature_c: float
+    isa_temp_c: float
+    isa_deviation_c: float
+    performance_factor: float
+    roc_loss_fpm: float
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceData:
     """Aircraft performance data at specific conditions"""
     ias_mph: float
@@ -28,9 +58,50 @@ class PerformanceData:
     isa_deviation_c: float
     performance_factor: float
     roc_loss_fpm: float
+    
+    # Decimal places used when presenting each field (None = shown as given)
+    _DISPLAY_PLACES = {
+        'ias_mph': 1, 'roc_fpm': 1, 'fuel_gal': 2,
+        'pressure_altitude_ft': None, 'density_altitude_ft': 0, 'temperature_c': None,
+        'isa_temp_c': 1, 'isa_deviation_c': 1, 'performance_factor': 3, 'roc_loss_fpm': 1,
+    }
+    
+    def as_display_dict(self) -> dict:
+        """Field values rounded for presentation"""
+        display = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            places = self._DISPLAY_PLACES[field.name]
+            display[field.name] = value if places is None else round(value, places)
+        return display
+    
+    def __str__(self):
+        values = ", ".join(f"{name}={value}" for name, value in self.as_display_dict().items())
+        return f"{type(self).__name__}({values})"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)  # array fields: compare by identity, hash by id
+class PerformanceBatch:
+    """Aircraft performance data for many conditions at once (one array per field)"""
+    ias_mph: np.ndarray
+    roc_fpm: np.ndarray
+    fuel_gal: np.ndarray
+    pressure_altitude_ft: np.ndarray
+    density_altitude_ft: np.ndarray
+    temperature_c: np.ndarray
+    isa_temp_c: np.ndarray
+    isa_deviation_c: np.ndarray
+    performance_factor: np.ndarray
+    roc_loss_fpm: np.ndarray
+    valid: np.ndarray  # False where the point is outside the data bounds (performance fields are NaN there)
+    
+    def to_tuples(self) -> List[PerfTuple]:
+        """Valid points as a flat list of PerfTuple records"""
+        columns = [getattr(self, name)[self.valid].tolist() for name in PerfTuple._fields]
+        return list(map(PerfTuple._make, zip(*columns)))
+
+
+@dataclass(slots=True, frozen=True)
 class ClimbSegment:
     """Climb performance data for an altitude segment"""
     start_altitude_ft: float
@@ -44,94 +115,404 @@ class ClimbSegment:
     start_density_alt_ft: float
     end_density_alt_ft: float
     temperature_c: float
+    start_perf: PerformanceData  # Temperature-corrected performance at the start altitude
+    end_perf: PerformanceData  # Temperature-corrected performance at the end altitude
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataBounds:
     """Valid data bounds for calculations"""
     altitude_range_ft: Tuple[float, float]
     weight_range_lbs: Tuple[float, float]
 
+# Structured (one record per segment) result of AircraftPerformance.get_climb_profile
+SEGMENT_DTYPE = np.dtype([
+    ('start_altitude_ft', 'f4'),
+    ('end_altitude_ft', 'f4'),
+    ('altitude_gain_ft', 'f4'),
+    ('avg_roc_fpm', 'f4'),
+    ('segment_fuel_gal', 'f4'),
+    ('climb_time_min', 'f4'),
+    ('start_ias_mph', 'f4'),
+    ('end_ias_mph', 'f4'),
+    ('start_density_alt_ft', 'f4'),
+    ('end_density_alt_ft', 'f4'),
+    ('valid', '?'),
+])
+
+# ISA temperature coefficients: ISA = 15 - 0.002 * PA  (°C, 2°C per 1000 ft lapse rate)
+_ISA_SEA_LEVEL_C = 15.0
+_ISA_LAPSE_C_PER_FT = 0.002
+
+
+def _isa_temp_c(pressure_altitude_ft):
+    """ISA temperature in Celsius at a pressure altitude (scalar or NumPy array)"""
+    return _ISA_SEA_LEVEL_C - _ISA_LAPSE_C_PER_FT * pressure_altitude_ft
+
+# Density altitude approximation, folded into a single affine expression:
+#   Density altitude: DA  = PA + 120 * (T - ISA)        (~120 ft per °C above ISA)
+#                  => DA  = (1 + 120 * 0.002) * PA + 120 * T - 120 * 15
+#                     DA  = 1.24 * PA + 120 * T - 1800
+_DA_TEMPERATURE_COEFF = 120.0
+_DA_PRESSURE_ALT_COEFF = 1 + _DA_TEMPERATURE_COEFF * _ISA_LAPSE_C_PER_FT
+_DA_OFFSET_FT = _DA_TEMPERATURE_COEFF * _ISA_SEA_LEVEL_C
+
 # Performance data tables
 ALTITUDES = [0, 5000, 10000, 15000]  # feet
 WEIGHTS = [1700, 2000, 2300]  # pounds
 
-# Indicated Airspeed (mph) - (altitude, weight) -> IAS
-IAS_DATA = {
-    (0, 1700): 75,  (0, 2000): 77,  (0, 2300): 80,
-    (5000, 1700): 73, (5000, 2000): 76, (5000, 2300): 78,
-    (10000, 1700): 71, (10000, 2000): 74, (10000, 2300): 77,
-    (15000, 1700): 70, (15000, 2000): 73, (15000, 2300): 76,
-}
-
-# Rate of Climb (fpm) - (altitude, weight) -> ROC
-ROC_DATA = {
-    (0, 1700): 1085, (0, 2000): 840, (0, 2300): 645,
-    (5000, 1700): 825, (5000, 2000): 610, (5000, 2300): 435,
-    (10000, 1700): 570, (10000, 2000): 380, (10000, 2300): 230,
-    (15000, 1700): 315, (15000, 2000): 155, (15000, 2300): 22,
-}
-
-# Fuel to reach altitude (gal) - (altitude, weight) -> Fuel
-FUEL_DATA = {
-    (0, 1700): 1.0, (0, 2000): 1.0, (0, 2300): 1.0,
-    (5000, 1700): 1.9, (5000, 2000): 2.2, (5000, 2300): 2.6,
-    (10000, 1700): 2.9, (10000, 2000): 3.6, (10000, 2300): 4.8,
-    (15000, 1700): 4.4, (15000, 2000): 6.3, (15000, 2300): 11.5,
-}
+# Grid coordinates as arrays
+ALTITUDES_ARR = np.array(ALTITUDES, dtype=np.float64)
+WEIGHTS_ARR = np.array(WEIGHTS, dtype=np.float64)
+
+# The interpolation kernels assume both grids are uniformly spaced (5000 ft / 300 lbs)
+# and pick the grid cell with a single division instead of searching the grid.
+# Keep ALTITUDES and WEIGHTS evenly spaced if the tables are ever extended.
+_ALT_MIN_FT = float(ALTITUDES[0])
+_ALT_MAX_FT = float(ALTITUDES[-1])
+_ALT_STEP_FT = float(ALTITUDES[1] - ALTITUDES[0])
+_ALT_CELLS = len(ALTITUDES) - 1
+_WT_MIN_LBS = float(WEIGHTS[0])
+_WT_MAX_LBS = float(WEIGHTS[-1])
+_WT_STEP_LBS = float(WEIGHTS[1] - WEIGHTS[0])
+_WT_CELLS = len(WEIGHTS) - 1
+
+# Performance table from the POH, one contiguous float64 array (288 bytes):
+# TABLE[altitude index, weight index] -> (IAS mph, Rate of Climb fpm, Fuel to altitude gal)
+# Each row is one altitude, columns are 1700 / 2000 / 2300 lbs
+TABLE = np.array([
+    [[75, 1085, 1.0], [77, 840, 1.0], [80, 645, 1.0]],    # 0 ft
+    [[73, 825, 1.9], [76, 610, 2.2], [78, 435, 2.6]],     # 5000 ft
+    [[71, 570, 2.9], [74, 380, 3.6], [77, 230, 4.8]],     # 10000 ft
+    [[70, 315, 4.4], [73, 155, 6.3], [76, 22, 11.5]],     # 15000 ft
+], dtype=np.float64)
+
+# Numba freezes TABLE into the compiled scalar kernels; keep it (and the views below)
+# read-only so the compiled copy can never diverge from it
+TABLE.setflags(write=False)
+
+# Per-metric (altitude, weight) views into TABLE
+IAS_ARR = TABLE[..., 0]
+ROC_ARR = TABLE[..., 1]
+FUEL_ARR = TABLE[..., 2]
+
+
+def _table_dict(metric):
+    """(altitude, weight) -> value mapping of one TABLE metric"""
+    return {(alt, wt): float(TABLE[i, j, metric])
+            for i, alt in enumerate(ALTITUDES) for j, wt in enumerate(WEIGHTS)}
+
+
+# Dict versions of the tables, kept for backward compatibility
+IAS_DATA = _table_dict(0)  # Indicated Airspeed (mph)
+ROC_DATA = _table_dict(1)  # Rate of Climb (fpm)
+FUEL_DATA = _table_dict(2)  # Fuel to reach altitude (gal)
+
+
+# Fast-math flags for the kernels - everything except 'nnan'/'ninf', since out-of-bounds
+# points are reported as NaN
+_FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _grid_cell(x, y):
+    """
+    Locate a point in the uniform ALTITUDES x WEIGHTS grid
+    
+    Args:
+        x, y: Altitude (ft) and weight (lbs)
+    
+    Returns:
+        tuple: (i0, j0, tx, ty, inside) - lower corner of the grid cell, interpolation
+        weights within it, and whether the point lies on the grid at all
+    """
+    # Clamp onto the grid unconditionally; callers flag out-of-bounds points after the blend
+    xc = min(max(x, _ALT_MIN_FT), _ALT_MAX_FT)
+    yc = min(max(y, _WT_MIN_LBS), _WT_MAX_LBS)
+    
+    # NaN survives the clamp; park it on the grid so the integer cast below is defined
+    if xc != xc:
+        xc = _ALT_MIN_FT
+    if yc != yc:
+        yc = _WT_MIN_LBS
+    
+    # Bucket directly into the uniform grid; the last grid point belongs to the last cell
+    x_off = xc - _ALT_MIN_FT
+    y_off = yc - _WT_MIN_LBS
+    i0 = max(min(int(x_off // _ALT_STEP_FT), _ALT_CELLS - 1), 0)
+    j0 = max(min(int(y_off // _WT_STEP_LBS), _WT_CELLS - 1), 0)
+    
+    # Calculate interpolation weights
+    tx = (x_off - i0 * _ALT_STEP_FT) / _ALT_STEP_FT
+    ty = (y_off - j0 * _WT_STEP_LBS) / _WT_STEP_LBS
+    
+    return i0, j0, tx, ty, x == xc and y == yc
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _bilerp3(x, y, table):
+    """
+    Bilinear interpolation of all three metrics at a single point
+    
+    Args:
+        x, y: Altitude (ft) and weight (lbs)
+        table: (n_alt, n_wt, 3) metric table on the uniform ALTITUDES x WEIGHTS grid
+    
+    Returns:
+        tuple: (ias_mph, roc_fpm, fuel_gal), all NaN if the point is outside the grid
+    """
+    i0, j0, tx, ty, inside = _grid_cell(x, y)
+    i1 = i0 + 1
+    j1 = j0 + 1
+    w00 = (1 - tx) * (1 - ty)  # bottom-left
+    w10 = tx * (1 - ty)  # bottom-right
+    w01 = (1 - tx) * ty  # top-left
+    w11 = tx * ty  # top-right
+    
+    ias = w00 * table[i0, j0, 0] + w10 * table[i1, j0, 0] + w01 * table[i0, j1, 0] + w11 * table[i1, j1, 0]
+    roc = w00 * table[i0, j0, 1] + w10 * table[i1, j0, 1] + w01 * table[i0, j1, 1] + w11 * table[i1, j1, 1]
+    fuel = w00 * table[i0, j0, 2] + w10 * table[i1, j0, 2] + w01 * table[i0, j1, 2] + w11 * table[i1, j1, 2]
+    
+    if not inside:
+        return np.nan, np.nan, np.nan
+    return ias, roc, fuel
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _bilerp_roc(x, y, table):
+    """
+    Bilinear interpolation of rate of climb only at a single point
+    
+    Args:
+        x, y: Altitude (ft) and weight (lbs)
+        table: (n_alt, n_wt, 3) metric table on the uniform ALTITUDES x WEIGHTS grid
+    
+    Returns:
+        float: roc_fpm, NaN if the point is outside the grid
+    """
+    i0, j0, tx, ty, inside = _grid_cell(x, y)
+    roc = (1 - tx) * (1 - ty) * table[i0, j0, 1] + tx * (1 - ty) * table[i0 + 1, j0, 1] + \
+          (1 - tx) * ty * table[i0, j0 + 1, 1] + tx * ty * table[i0 + 1, j0 + 1, 1]
+    
+    if not inside:
+        return np.nan
+    return roc
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _bilerp3_frozen(x, y):
+    """
+    _bilerp3 specialized to the module-level TABLE
+    
+    Numba freezes global arrays into the compiled code, so together with the grid
+    constants every table load and bound becomes a literal.
+    
+    Returns:
+        tuple: (ias_mph, roc_fpm, fuel_gal), all NaN if the point is outside the grid
+    """
+    return _bilerp3(x, y, TABLE)
+
+
+@njit(cache=True, fastmath=_FASTMATH_FLAGS)
+def _bilerp_roc_frozen(x, y):
+    """
+    _bilerp_roc specialized to the module-level TABLE
+    
+    Returns:
+        float: roc_fpm, NaN if the point is outside the grid
+    """
+    return _bilerp_roc(x, y, TABLE)
+
+
+# Below this many points, thread start-up costs more than the parallel batch kernel saves
+_PARALLEL_MIN_POINTS = 1024
+
+
+@njit(cache=True, parallel=True, fastmath=_FASTMATH_FLAGS)
+def _bilerp_batch(x, y, out, table):
+    """
+    Parallel bilinear interpolation of all three metrics over flat arrays of points
+    
+    Args:
+        x, y: 1D arrays of altitudes (ft) and weights (lbs)
+        out: Preallocated (len(x), 3) output array, filled with [ias_mph, roc_fpm, fuel_gal]
+            (NaN for points outside the grid)
+        table: (n_alt, n_wt, 3) metric table on the uniform ALTITUDES x WEIGHTS grid
+    """
+    for k in prange(x.shape[0]):
+        ias, roc, fuel = _bilerp3(x[k], y[k], table)
+        out[k, 0] = ias
+        out[k, 1] = roc
+        out[k, 2] = fuel
+
+
+@lru_cache(maxsize=4096)
+def _bilerp3_cached(x, y):
+    """Memoized _bilerp3_frozen at a quantized point"""
+    return _bilerp3_frozen(x, y)
+
+
+@lru_cache(maxsize=4096)
+def _bilerp_roc_cached(x, y):
+    """Memoized _bilerp_roc_frozen at a quantized point"""
+    return _bilerp_roc_frozen(x, y)
+
+
+def _interp3_quantized(altitude_ft, weight_lbs):
+    """(ias_mph, roc_fpm, fuel_gal) at a point, interpolated at the nearest whole foot and pound"""
+    return _bilerp3_cached(float(round(altitude_ft)), float(round(weight_lbs)))
+
+
+def _interp_roc_quantized(altitude_ft, weight_lbs):
+    """roc_fpm at a point, interpolated at the nearest whole foot and pound"""
+    return _bilerp_roc_cached(float(round(altitude_ft)), float(round(weight_lbs)))
+
+
+def _interp3_exact(altitude_ft, weight_lbs):
+    """(ias_mph, roc_fpm, fuel_gal) at a point"""
+    return _bilerp3_frozen(float(altitude_ft), float(weight_lbs))
+
+
+def _interp_roc_exact(altitude_ft, weight_lbs):
+    """roc_fpm at a point"""
+    return _bilerp_roc_frozen(float(altitude_ft), float(weight_lbs))
+
+
+# Scalar interpolators for get_performance_tuple. A compiled kernel call is cheaper than a
+# cache hit, so with numba points are interpolated exactly; as plain Python the kernels
+# cost about ten cache hits, so they are memoized on points quantized to 1 ft / 1 lb
+if HAVE_NUMBA:
+    _interp3_scalar, _interp_roc_scalar = _interp3_exact, _interp_roc_exact
+else:
+    _interp3_scalar, _interp_roc_scalar = _interp3_quantized, _interp_roc_quantized
+
+
+def _density_altitude_ft(pressure_altitude_ft, temperature_c):
+    """Density altitude in feet (scalar or NumPy array), see _DA_PRESSURE_ALT_COEFF"""
+    return (_DA_PRESSURE_ALT_COEFF * pressure_altitude_ft
+            + _DA_TEMPERATURE_COEFF * temperature_c - _DA_OFFSET_FT)
+
+
+def _temperature_corrected(pressure_altitude_ft, weight_lbs, temperature_c, interp3, interp_roc):
+    """
+    Temperature-corrected performance, elementwise for scalars or NumPy arrays
+    
+    Args:
+        pressure_altitude_ft, weight_lbs, temperature_c: Conditions to evaluate
+        interp3: Function (altitude, weight) -> (ias_mph, roc_fpm, fuel_gal)
+        interp_roc: Function (altitude, weight) -> roc_fpm
+    
+    Returns:
+        PerfTuple of the corrected fields; the performance fields are NaN wherever the
+        interpolators report a point outside the data grid
+    """
+    # Calculate atmospheric conditions
+    density_alt = _density_altitude_ft(pressure_altitude_ft, temperature_c)
+    isa_temp = _isa_temp_c(pressure_altitude_ft)
+    
+    # Performance at density altitude (temperature-corrected), and standard ROC at
+    # pressure altitude for comparison. ROC is positive throughout the data, so the
+    # performance factor is defined wherever both points are on the grid
+    ias, roc, fuel = interp3(density_alt, weight_lbs)
+    std_roc = interp_roc(pressure_altitude_ft, weight_lbs)
+    
+    return PerfTuple(ias, roc, fuel, pressure_altitude_ft, density_alt, temperature_c,
+                     isa_temp, temperature_c - isa_temp, roc / std_roc, std_roc - roc)
 
 
 class AircraftPerformance:
     """Aircraft performance calculator with temperature correction capabilities"""
     
-    def __init__(self):
-        self.altitudes = ALTITUDES
-        self.weights = WEIGHTS
-        self.ias_data = IAS_DATA
-        self.roc_data = ROC_DATA
-        self.fuel_data = FUEL_DATA
+    # Valid data range; DataBounds is frozen so one instance is shared
+    _DATA_BOUNDS = DataBounds(altitude_range_ft=(_ALT_MIN_FT, _ALT_MAX_FT),
+                              weight_range_lbs=(_WT_MIN_LBS, _WT_MAX_LBS))
     
-    def _bilinear_interpolation(self, x, y, grid_x, grid_y, values):
+    def _bilinear3(self, x, y):
         """
-        Perform bilinear interpolation on a 2D grid
+        Interpolate IAS, ROC and fuel together with a single weight computation
         
         Args:
-            x, y: Point to interpolate at
-            grid_x, grid_y: Grid coordinate arrays
-            values: Dictionary with (grid_x, grid_y) -> value mapping
+            x, y: Altitude (ft) and weight (lbs) to interpolate at
         
         Returns:
-            Interpolated value
+            tuple: (ias_mph, roc_fpm, fuel_gal)
         """
-        # Check bounds
-        if not (grid_x[0] <= x <= grid_x[-1] and grid_y[0] <= y <= grid_y[-1]):
+        result = _bilerp3_frozen(float(x), float(y))
+        if math.isnan(result[0]):
             raise ValueError(f"Point ({x}, {y}) is outside the data grid bounds")
         
-        # Find bounding grid points
-        x0 = max([gx for gx in grid_x if gx <= x])
-        x1 = min([gx for gx in grid_x if gx >= x])
-        y0 = max([gy for gy in grid_y if gy <= y])
-        y1 = min([gy for gy in grid_y if gy >= y])
+        return result
+    
+    def _bilinear_batch(self, x, y, table=None):
+        """
+        Vectorized bilinear interpolation of IAS, ROC and fuel
+        
+        Args:
+            x, y: Arrays of altitudes (ft) and weights (lbs) of the same shape
+            table: (n_alt, n_wt, k) table to interpolate, defaults to all three metrics
         
-        # Handle exact grid point case
-        if x0 == x1 and y0 == y1:
-            return values[(x0, y0)]
+        Returns:
+            np.ndarray of shape x.shape + (k,), by default [ias_mph, roc_fpm, fuel_gal];
+            points outside the grid are NaN
+        """
+        # Clamp onto the grid unconditionally; out-of-bounds points are flagged after the blend
+        xc = np.clip(x, _ALT_MIN_FT, _ALT_MAX_FT)
+        yc = np.clip(y, _WT_MIN_LBS, _WT_MAX_LBS)
+        oob = (x != xc) | (y != yc)
         
-        # Calculate interpolation weights
-        tx = 0 if x1 == x0 else (x - x0) / (x1 - x0)
-        ty = 0 if y1 == y0 else (y - y0) / (y1 - y0)
+        # Bucket directly into the uniform grid; the last grid point belongs to the last cell.
+        # Clamping from below too keeps NaN (which casts to the most negative integer) on the grid
+        x_off = xc - _ALT_MIN_FT
+        y_off = yc - _WT_MIN_LBS
+        with np.errstate(invalid='ignore'):
+            i0 = np.maximum(np.minimum((x_off // _ALT_STEP_FT).astype(np.intp), _ALT_CELLS - 1), 0)
+            j0 = np.maximum(np.minimum((y_off // _WT_STEP_LBS).astype(np.intp), _WT_CELLS - 1), 0)
+        i1 = i0 + 1
+        j1 = j0 + 1
         
-        # Get corner values
-        v00 = values[(x0, y0)]  # bottom-left
-        v10 = values[(x1, y0)]  # bottom-right
-        v01 = values[(x0, y1)]  # top-left
-        v11 = values[(x1, y1)]  # top-right
+        tx = ((x_off - i0 * _ALT_STEP_FT) / _ALT_STEP_FT)[..., np.newaxis]
+        ty = ((y_off - j0 * _WT_STEP_LBS) / _WT_STEP_LBS)[..., np.newaxis]
         
-        # Bilinear interpolation formula
-        result = (1 - tx) * (1 - ty) * v00 + tx * (1 - ty) * v10 + \
-                 (1 - tx) * ty * v01 + tx * ty * v11
+        if table is None:
+            table = TABLE
+        result = (1 - tx) * (1 - ty) * table[i0, j0] + tx * (1 - ty) * table[i1, j0] + \
+                 (1 - tx) * ty * table[i0, j1] + tx * ty * table[i1, j1]
         
-        return result
+        return np.where(oob[..., np.newaxis], np.nan, result)
+    
+    def _interp_batch(self, x, y):
+        """
+        Vectorized interpolation of IAS, ROC and fuel
+        
+        Large batches use the parallel numba kernel when it is installed, smaller
+        ones the NumPy kernel.
+        
+        Args:
+            x, y: Arrays of altitudes (ft) and weights (lbs) of the same shape
+        
+        Returns:
+            np.ndarray of shape x.shape + (3,) with [ias_mph, roc_fpm, fuel_gal];
+            points outside the grid are NaN
+        """
+        if HAVE_NUMBA and x.size >= _PARALLEL_MIN_POINTS:
+            out = np.empty((x.size, 3), dtype=np.float64)
+            _bilerp_batch(x.ravel(), y.ravel(), out, TABLE)
+            return out.reshape(x.shape + (3,))
+        return self._bilinear_batch(x, y)
+    
+    def _interp_roc_only(self, x, y):
+        """
+        Vectorized interpolation of rate of climb only
+        
+        Args:
+            x, y: Arrays of altitudes (ft) and weights (lbs) of the same shape
+        
+        Returns:
+            np.ndarray of shape x.shape with roc_fpm; points outside the grid are NaN
+        """
+        if HAVE_NUMBA and x.size >= _PARALLEL_MIN_POINTS:
+            return self._interp_batch(x, y)[..., 1]
+        return self._bilinear_batch(x, y, TABLE[..., 1:2])[..., 0]
     
     def get_performance_standard(self, altitude_ft, weight_lbs):
         """
@@ -142,37 +523,86 @@ class AircraftPerformance:
             weight_lbs: Gross weight in pounds
             
         Returns:
-            tuple: (ias_mph, roc_fpm, fuel_gal)
+            tuple: (ias_mph, roc_fpm, fuel_gal), unrounded
+        """
+        return self._bilinear3(altitude_ft, weight_lbs)
+    
+    def get_performance_standard_batch(self, altitudes_ft, weights_lbs):
         """
-        ias = self._bilinear_interpolation(altitude_ft, weight_lbs, 
-                                         self.altitudes, self.weights, self.ias_data)
-        roc = self._bilinear_interpolation(altitude_ft, weight_lbs,
-                                         self.altitudes, self.weights, self.roc_data)
-        fuel = self._bilinear_interpolation(altitude_ft, weight_lbs,
-                                          self.altitudes, self.weights, self.fuel_data)
+        Get aircraft performance at standard atmospheric conditions for many points at once
         
-        return round(ias, 1), round(roc, 1), round(fuel, 2)
+        Args:
+            altitudes_ft: Array-like of altitudes in feet
+            weights_lbs: Array-like of gross weights in pounds (broadcast against altitudes_ft)
+            
+        Returns:
+            tuple: (ias_mph, roc_fpm, fuel_gal) arrays; points outside the data grid are NaN
+        """
+        altitude, weight = np.broadcast_arrays(np.asarray(altitudes_ft, dtype=np.float64),
+                                               np.asarray(weights_lbs, dtype=np.float64))
+        perf = self._interp_batch(altitude, weight)
+        return perf[..., 0], perf[..., 1], perf[..., 2]
     
     def calculate_density_altitude(self, pressure_altitude_ft, temperature_c):
         """
         Calculate density altitude using standard atmospheric formulas
         
         Args:
-            pressure_altitude_ft: Pressure altitude in feet
-            temperature_c: Outside air temperature in Celsius
+            pressure_altitude_ft: Pressure altitude in feet (scalar or NumPy array)
+            temperature_c: Outside air temperature in Celsius (scalar or NumPy array)
             
         Returns:
-            Density altitude in feet
+            Density altitude in feet, elementwise for array inputs
         """
         # ISA (International Standard Atmosphere) temperature at pressure altitude
-        # Sea level: 15°C, lapse rate: 2°C per 1000 ft
-        isa_temp_c = 15 - (2 * pressure_altitude_ft / 1000)
+        # (sea level: 15°C, lapse rate: 2°C per 1000 ft) and ~120 ft of density
+        # altitude per degree above ISA, folded into one expression
+        return _density_altitude_ft(pressure_altitude_ft, temperature_c)
+    
+    def get_performance_batch(self, pressure_altitudes_ft, weights_lbs, temperatures_c) -> PerformanceBatch:
+        """
+        Get temperature-corrected aircraft performance for many conditions at once
         
-        # Density altitude approximation
-        # For every degree above ISA, density altitude increases ~120 ft
-        density_altitude = pressure_altitude_ft + (120 * (temperature_c - isa_temp_c))
+        Args:
+            pressure_altitudes_ft: Array-like of pressure altitudes in feet
+            weights_lbs: Array-like of aircraft gross weights in pounds
+            temperatures_c: Array-like of outside air temperatures in Celsius
+            
+        Returns:
+            PerformanceBatch with one array per field (inputs are broadcast together).
+            Points outside the data bounds have valid=False and NaN in ias_mph, roc_fpm,
+            fuel_gal, performance_factor and roc_loss_fpm; the atmospheric fields
+            (pressure and density altitude, temperature, ISA temperature and deviation)
+            are always reported.
+        """
+        pressure_alt, weight, temperature = np.broadcast_arrays(
+            np.asarray(pressure_altitudes_ft, dtype=np.float64),
+            np.asarray(weights_lbs, dtype=np.float64),
+            np.asarray(temperatures_c, dtype=np.float64),
+        )
+        
+        perf = _temperature_corrected(pressure_alt, weight, temperature,
+                                      self.get_performance_standard_batch, self._interp_roc_only)
         
-        return density_altitude
+        # Both the density and the pressure altitude must be inside the data grid
+        valid = ~np.isnan(perf.roc_loss_fpm)
+        
+        def masked(values):
+            return np.where(valid, values, np.nan)
+        
+        return PerformanceBatch(
+            ias_mph=masked(perf.ias_mph),
+            roc_fpm=masked(perf.roc_fpm),
+            fuel_gal=masked(perf.fuel_gal),
+            pressure_altitude_ft=pressure_alt,
+            density_altitude_ft=perf.density_altitude_ft,
+            temperature_c=temperature,
+            isa_temp_c=perf.isa_temp_c,
+            isa_deviation_c=perf.isa_deviation_c,
+            performance_factor=masked(perf.performance_factor),
+            roc_loss_fpm=masked(perf.roc_loss_fpm),
+            valid=valid
+        )
     
     def get_performance_with_temperature(self, pressure_altitude_ft, weight_lbs, temperature_c) -> Optional[PerformanceData]:
         """
@@ -184,50 +614,62 @@ class AircraftPerformance:
             temperature_c: Outside air temperature in Celsius
             
         Returns:
-            PerformanceData object with temperature correction info, or None if out of bounds
-        """
-        # Calculate atmospheric conditions
-        density_alt = self.calculate_density_altitude(pressure_altitude_ft, temperature_c)
-        isa_temp = 15 - (2 * pressure_altitude_ft / 1000)
-        isa_deviation = temperature_c - isa_temp
-        
-        # Check if density altitude is within data bounds
-        if not (min(self.altitudes) <= density_alt <= max(self.altitudes)):
-            return None
+            PerformanceData object with temperature correction info, or None if out of bounds.
+            Values are unrounded; use str() or as_display_dict() for presentation.
             
-        if not (min(self.weights) <= weight_lbs <= max(self.weights)):
+        Note:
+            Without numba, interpolation results are cached at altitudes and weights
+            quantized to 1 ft / 1 lb
+        """
+        perf = self.get_performance_tuple(pressure_altitude_ft, weight_lbs, temperature_c)
+        if perf is None:
             return None
+        return PerformanceData(*perf)
+    
+    def get_performance_tuple(self, pressure_altitude_ft, weight_lbs, temperature_c) -> Optional[PerfTuple]:
+        """
+        Get aircraft performance corrected for temperature effects as a lightweight PerfTuple
         
-        try:
-            # Get performance at density altitude (temperature-corrected)
-            ias, roc, fuel = self.get_performance_standard(density_alt, weight_lbs)
-            
-            # For comparison, get standard performance at pressure altitude
-            std_ias, std_roc, std_fuel = self.get_performance_standard(pressure_altitude_ft, weight_lbs)
-            performance_factor = roc / std_roc if std_roc > 0 else 0
-            
-            return PerformanceData(
-                ias_mph=ias,
-                roc_fpm=roc,
-                fuel_gal=fuel,
-                pressure_altitude_ft=pressure_altitude_ft,
-                density_altitude_ft=round(density_alt, 0),
-                temperature_c=temperature_c,
-                isa_temp_c=round(isa_temp, 1),
-                isa_deviation_c=round(isa_deviation, 1),
-                performance_factor=round(performance_factor, 3),
-                roc_loss_fpm=round(std_roc - roc, 1)
-            )
+        Same as get_performance_with_temperature but skips building a PerformanceData,
+        for loops that evaluate many points.
+        
+        Args:
+            pressure_altitude_ft: Pressure altitude in feet
+            weight_lbs: Aircraft gross weight in pounds
+            temperature_c: Outside air temperature in Celsius
             
-        except ValueError:
+        Returns:
+            PerfTuple, or None if out of bounds
+        """
+        # Check the requested conditions (not any quantized cache keys) against the data bounds
+        density_alt = _density_altitude_ft(pressure_altitude_ft, temperature_c)
+        if not (self.is_in_bounds(pressure_altitude_ft, weight_lbs) and self.is_in_bounds(density_alt, weight_lbs)):
             return None
+        
+        return _temperature_corrected(pressure_altitude_ft, weight_lbs, temperature_c,
+                                      _interp3_scalar, _interp_roc_scalar)
     
     def get_data_bounds(self) -> DataBounds:
         """Get the valid data bounds for calculations"""
-        return DataBounds(
-            altitude_range_ft=(min(self.altitudes), max(self.altitudes)),
-            weight_range_lbs=(min(self.weights), max(self.weights))
-        )
+        return self._DATA_BOUNDS
+    
+    def is_in_bounds(self, altitude_ft, weight_lbs) -> bool:
+        """
+        Check whether a point lies inside the performance data grid
+        
+        Cheap pre-check for callers that would otherwise rely on get_performance_standard
+        raising ValueError.
+        
+        Args:
+            altitude_ft: Altitude in feet
+            weight_lbs: Gross weight in pounds
+            
+        Returns:
+            True if the point can be interpolated
+        """
+        bounds = self._DATA_BOUNDS
+        return (bounds.altitude_range_ft[0] <= altitude_ft <= bounds.altitude_range_ft[1]
+                and bounds.weight_range_lbs[0] <= weight_lbs <= bounds.weight_range_lbs[1])
     
     def get_climb_segment_performance(self, start_altitude_ft, end_altitude_ft, weight_lbs, start_temperature_c) -> Optional[ClimbSegment]:
         """
@@ -249,17 +691,12 @@ class AircraftPerformance:
             return None
             
         # Calculate temperature at end altitude using standard lapse rate (2°C/1000ft)
-        altitude_diff_1000ft = (end_altitude_ft - start_altitude_ft) / 1000
-        end_temperature_c = start_temperature_c - (2.0 * altitude_diff_1000ft)
-            
-        # Get performance at start altitude
+        end_temperature_c = start_temperature_c - _ISA_LAPSE_C_PER_FT * (end_altitude_ft - start_altitude_ft)
+        
+        # Get performance at start and end altitude
         start_perf = self.get_performance_with_temperature(start_altitude_ft, weight_lbs, start_temperature_c)
-        if not start_perf:
-            return None
-            
-        # Get performance at end altitude with calculated temperature
         end_perf = self.get_performance_with_temperature(end_altitude_ft, weight_lbs, end_temperature_c)
-        if not end_perf:
+        if start_perf is None or end_perf is None:
             return None
         
         # Calculate segment metrics
@@ -282,11 +719,78 @@ class AircraftPerformance:
             avg_roc_fpm=round(avg_roc, 1),
             segment_fuel_gal=round(segment_fuel, 2),
             climb_time_min=round(climb_time_min, 1),
-            start_ias_mph=start_perf.ias_mph,
-            end_ias_mph=end_perf.ias_mph,
-            start_density_alt_ft=start_perf.density_altitude_ft,
-            end_density_alt_ft=end_perf.density_altitude_ft,
-            temperature_c=start_temperature_c  # Store the starting temperature
+            start_ias_mph=round(start_perf.ias_mph, 1),
+            end_ias_mph=round(end_perf.ias_mph, 1),
+            start_density_alt_ft=round(start_perf.density_altitude_ft, 0),
+            end_density_alt_ft=round(end_perf.density_altitude_ft, 0),
+            temperature_c=start_temperature_c,  # Store the starting temperature
+            start_perf=start_perf,
+            end_perf=end_perf
         )
     
+    def get_climb_profile(self, altitude_breaks_ft, weight_lbs, start_temperature_c) -> np.ndarray:
+        """
+        Get climb performance for consecutive altitude segments in one vectorized pass
+        
+        Args:
+            altitude_breaks_ft: Increasing altitudes in feet; segment k runs from
+                altitude_breaks_ft[k] to altitude_breaks_ft[k + 1]
+            weight_lbs: Aircraft gross weight in pounds
+            start_temperature_c: Temperature at the first altitude in Celsius
+            
+        Returns:
+            Structured array of SEGMENT_DTYPE with one record per segment (empty for
+            fewer than two breaks). Segments that are out of bounds or not climbing have
+            valid=False and NaN in every field except the altitudes and altitude gain.
+            
+        Note:
+            Temperature varies with altitude using standard lapse rate (2°C/1000ft)
+        """
+        breaks = np.asarray(altitude_breaks_ft, dtype=np.float64)
+        if breaks.size < 2:
+            return np.empty(0, dtype=SEGMENT_DTYPE)
+        
+        temperatures = start_temperature_c - _ISA_LAPSE_C_PER_FT * (breaks - breaks[0])
+        perf = self.get_performance_batch(breaks, weight_lbs, temperatures)
+        
+        # Calculate segment metrics between consecutive breaks
+        altitude_gain = np.diff(breaks)
+        avg_roc = (perf.roc_fpm[:-1] + perf.roc_fpm[1:]) / 2
+        segment_fuel = np.diff(perf.fuel_gal)
+        valid = perf.valid[:-1] & perf.valid[1:] & (altitude_gain > 0)
+        
+        # Time calculation using average ROC (cannot climb with zero or negative ROC)
+        climb_time = np.divide(altitude_gain, avg_roc, out=np.full_like(avg_roc, np.inf), where=avg_roc > 0)
+        
+        def masked(values):
+            return np.where(valid, values, np.nan)
+        
+        profile = np.empty(len(altitude_gain), dtype=SEGMENT_DTYPE)
+        profile['start_altitude_ft'] = breaks[:-1]
+        profile['end_altitude_ft'] = breaks[1:]
+        profile['altitude_gain_ft'] = altitude_gain
+        profile['avg_roc_fpm'] = masked(avg_roc)
+        profile['segment_fuel_gal'] = masked(segment_fuel)
+        profile['climb_time_min'] = masked(climb_time)
+        profile['start_ias_mph'] = masked(perf.ias_mph[:-1])
+        profile['end_ias_mph'] = masked(perf.ias_mph[1:])
+        profile['start_density_alt_ft'] = masked(perf.density_altitude_ft[:-1])
+        profile['end_density_alt_ft'] = masked(perf.density_altitude_ft[1:])
+        profile['valid'] = valid
+        return profile
+
+
+# Shared calculator instance, built on first use
+_DEFAULT = None
+
 
+def get_default_calculator() -> AircraftPerformance:
+    """Get the process-wide AircraftPerformance instance, creating it on first use"""
+    global _DEFAULT
+    if _DEFAULT is None:
+        # Compile (or load from numba's on-disk cache) the scalar kernels up front so the
+        # first lookup does not pay the JIT cost
+        _bilerp3_frozen(_ALT_MIN_FT, _WT_MIN_LBS)
+        _bilerp_roc_frozen(_ALT_MIN_FT, _WT_MIN_LBS)
+        _DEFAULT = AircraftPerformance()
+    return _DEFAULT
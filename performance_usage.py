@@ -4,10 +4,10 @@ Aircraft climb segment performance calculator
 Calculates accurate climb performance between two specific altitudes
 """
 
-from aircraft_performance import AircraftPerformance
+from aircraft_performance import get_default_calculator
 
 def main():
-    calc = AircraftPerformance()
+    calc = get_default_calculator()
     
     # CLIMB SEGMENT: Accurate performance between specific altitudes
     start_altitude_ft = 7500       # Starting altitude (use 0 for sea level)
@@ -41,8 +41,8 @@ def main():
     else:
         print("ERROR: Cannot calculate segment")
         bounds = calc.get_data_bounds()
-        print(f"Valid altitude range: {bounds.altitude_range_ft[0]} - {bounds.altitude_range_ft[1]} ft")
-        print(f"Valid weight range: {bounds.weight_range_lbs[0]} - {bounds.weight_range_lbs[1]} lbs")
+        print(f"Valid altitude range: {bounds.altitude_range_ft[0]:.0f} - {bounds.altitude_range_ft[1]:.0f} ft")
+        print(f"Valid weight range: {bounds.weight_range_lbs[0]:.0f} - {bounds.weight_range_lbs[1]:.0f} lbs")
         
         # Check for density altitude issues (calculate end temperature using lapse rate)
         end_temperature_c = temperature_c - (2.0 * (end_altitude_ft - start_altitude_ft) / 1000)
@@ -6,151 +6,208 @@ Tests the interpolation functions against hardcoded performance data
 to ensure accuracy and prevent regression.
 """
 
+import logging
+import os
 import unittest
+from collections import namedtuple
+from math import isclose
+
+import numpy as np
+
 from aircraft_performance import (
     AircraftPerformance, 
     PerformanceData, 
+    PerformanceBatch, 
+    PerfTuple,
     ClimbSegment, 
     DataBounds,
+    HAVE_NUMBA,
+    _bilerp3_cached,
+    SEGMENT_DTYPE,
     IAS_DATA,
     ROC_DATA, 
     FUEL_DATA,
+    IAS_ARR,
+    ROC_ARR,
+    FUEL_ARR,
     ALTITUDES,
-    WEIGHTS
+    WEIGHTS,
+    get_default_calculator
+)
+
+# Progress messages are only shown when debug logging is enabled for this module,
+# e.g. by running with VERBOSE_TESTS=1
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG if os.environ.get('VERBOSE_TESTS') else logging.WARNING)
+
+# Published POH climb data, kept independently of the module's tables so that a typo or
+# swapped row there is caught: (altitude, weight) -> value
+POH_IAS = {
+    (0, 1700): 75,  (0, 2000): 77,  (0, 2300): 80,
+    (5000, 1700): 73, (5000, 2000): 76, (5000, 2300): 78,
+    (10000, 1700): 71, (10000, 2000): 74, (10000, 2300): 77,
+    (15000, 1700): 70, (15000, 2000): 73, (15000, 2300): 76,
+}
+POH_ROC = {
+    (0, 1700): 1085, (0, 2000): 840, (0, 2300): 645,
+    (5000, 1700): 825, (5000, 2000): 610, (5000, 2300): 435,
+    (10000, 1700): 570, (10000, 2000): 380, (10000, 2300): 230,
+    (15000, 1700): 315, (15000, 2000): 155, (15000, 2300): 22,
+}
+POH_FUEL = {
+    (0, 1700): 1.0, (0, 2000): 1.0, (0, 2300): 1.0,
+    (5000, 1700): 1.9, (5000, 2000): 2.2, (5000, 2300): 2.6,
+    (10000, 1700): 2.9, (10000, 2000): 3.6, (10000, 2300): 4.8,
+    (15000, 1700): 4.4, (15000, 2000): 6.3, (15000, 2300): 11.5,
+}
+
+# Expected (low, high) bounds of each metric at an interpolated point
+Range = namedtuple('Range', 'ias_lo ias_hi roc_lo roc_hi fuel_lo fuel_hi')
+
+# (altitude, weight, expected ranges) between grid points
+_INTERP_CASES = (
+    # Midpoint between four corners at sea level/5000ft and 1700/2000 lbs
+    (2500, 1850, Range(73, 77, 800, 1000, 1.0, 2.0)),
+    # Midpoint altitude, exact weight
+    (7500, 2000, Range(74, 76, 380, 610, 2.2, 3.6)),
+    # Exact altitude, midpoint weight
+    (10000, 2150, Range(74, 77, 230, 380, 3.6, 4.8)),
+)
+
+# (pressure altitude, ISA temperature): 15°C at sea level, 2°C lapse per 1000 ft
+_ISA_CASES = ((0, 15), (5000, 5), (10000, -5), (15000, -15))
+
+# (altitude, weight, hot day temperature, cold day temperature)
+_TEMP_EFFECT_CASES = (
+    (5000, 2000, 25, -5),  # ISA at 5000ft is 5°C: hot day ISA +20°C, cold day ISA -10°C
+)
+
+# (pressure altitude, temperature, expected approximate density altitude)
+_DA_CASES = (
+    (0, 15, 0),        # ISA at sea level
+    (0, 25, 1200),     # Hot day at sea level (ISA +10°C)
+    (0, 5, -1200),     # Cold day at sea level (ISA -10°C)
+    (5000, 5, 5000),   # ISA at 5000ft
+    (5000, 25, 7400),  # Hot day at 5000ft (ISA +20°C)
+)
+
+# (altitude, weight) at the exact data boundaries and just outside them
+_BOUNDARY_CASES = (
+    (0, 1700), (0, 2300),           # Min/max weight at min altitude
+    (15000, 1700), (15000, 2300),   # Min/max weight at max altitude
+)
+_OUT_OF_BOUNDS_CASES = (
+    (-1000, 2000),  # Below altitude range
+    (20000, 2000),  # Above altitude range
+    (5000, 1500),   # Below weight range
+    (5000, 2500),   # Above weight range
 )
 
 
 class TestAircraftPerformance(unittest.TestCase):
     """Test suite for AircraftPerformance class"""
     
-    def setUp(self):
-        """Set up test fixture"""
-        self.calc = AircraftPerformance()
+    @classmethod
+    def setUpClass(cls):
+        """Set up a calculator shared by all tests and the grid point coordinates"""
+        cls.calc = AircraftPerformance()
+        cls.ALT_GRID, cls.WT_GRID = np.meshgrid(ALTITUDES, WEIGHTS, indexing='ij')
+        
+        # Warm the lookup cache (and numba JIT, if any) before the individual tests
+        cls.calc.get_performance_with_temperature(0, 2000, 15)
     
     def test_exact_grid_points_standard_conditions(self):
         """Test that interpolation at exact grid points returns exact hardcoded values"""
-        print("\n=== Testing Exact Grid Points (Standard Conditions) ===")
-        
-        for altitude in ALTITUDES:
-            for weight in WEIGHTS:
-                with self.subTest(altitude=altitude, weight=weight):
-                    # Get standard performance (no temperature correction)
-                    ias, roc, fuel = self.calc.get_performance_standard(altitude, weight)
-                    
-                    # Expected values from hardcoded data
-                    expected_ias = IAS_DATA[(altitude, weight)]
-                    expected_roc = ROC_DATA[(altitude, weight)]
-                    expected_fuel = FUEL_DATA[(altitude, weight)]
-                    
-                    # Assert exact matches (allowing small floating point errors)
-                    self.assertAlmostEqual(ias, expected_ias, places=1,
-                        msg=f"IAS mismatch at {altitude}ft, {weight}lbs: got {ias}, expected {expected_ias}")
-                    self.assertAlmostEqual(roc, expected_roc, places=1,
-                        msg=f"ROC mismatch at {altitude}ft, {weight}lbs: got {roc}, expected {expected_roc}")
-                    self.assertAlmostEqual(fuel, expected_fuel, places=2,
-                        msg=f"Fuel mismatch at {altitude}ft, {weight}lbs: got {fuel}, expected {expected_fuel}")
-                    
-                    print(f"✓ {altitude:5d}ft, {weight}lbs: IAS={ias}, ROC={roc}, Fuel={fuel}")
+        logger.debug("=== Testing Exact Grid Points (Standard Conditions) ===")
+        
+        # Get standard performance (no temperature correction) for the whole grid at once
+        ias, roc, fuel = self.calc.get_performance_standard_batch(self.ALT_GRID, self.WT_GRID)
+        
+        # Assert exact matches against the hardcoded data (allowing small floating point errors)
+        np.testing.assert_allclose(ias, IAS_ARR, atol=0.1, err_msg="IAS mismatch at grid points")
+        np.testing.assert_allclose(roc, ROC_ARR, atol=0.1, err_msg="ROC mismatch at grid points")
+        np.testing.assert_allclose(fuel, FUEL_ARR, atol=0.01, err_msg="Fuel mismatch at grid points")
+        
+        # Grid points come back exactly as published, without single-precision noise
+        self.assertEqual(self.calc.get_performance_standard(5000, 1700), (73, 825, 1.9))
+        self.assertEqual(self.calc.get_performance_tuple(15000, 2000, -15).fuel_gal, 6.3)
+        
+        logger.debug(f"✓ {ias.size} grid points match the hardcoded data")
     
     def test_interpolation_between_grid_points(self):
         """Test bilinear interpolation between known grid points"""
-        print("\n=== Testing Interpolation Between Grid Points ===")
-        
-        # Test cases: (altitude, weight, expected_approximate_values)
-        test_cases = [
-            # Midpoint between four corners at sea level/5000ft and 1700/2000 lbs
-            (2500, 1850, {"ias_range": (73, 77), "roc_range": (800, 1000), "fuel_range": (1.0, 2.0)}),
-            
-            # Midpoint altitude, exact weight
-            (7500, 2000, {"ias_range": (74, 76), "roc_range": (380, 610), "fuel_range": (2.2, 3.6)}),
-            
-            # Exact altitude, midpoint weight  
-            (10000, 2150, {"ias_range": (74, 77), "roc_range": (230, 380), "fuel_range": (3.6, 4.8)}),
-        ]
-        
-        for altitude, weight, expected_ranges in test_cases:
-            with self.subTest(altitude=altitude, weight=weight):
-                ias, roc, fuel = self.calc.get_performance_standard(altitude, weight)
-                
-                # Check that interpolated values are within expected ranges
-                ias_range = expected_ranges["ias_range"]
-                roc_range = expected_ranges["roc_range"] 
-                fuel_range = expected_ranges["fuel_range"]
-                
-                self.assertGreaterEqual(ias, ias_range[0], f"IAS {ias} below expected range {ias_range}")
-                self.assertLessEqual(ias, ias_range[1], f"IAS {ias} above expected range {ias_range}")
-                
-                self.assertGreaterEqual(roc, roc_range[0], f"ROC {roc} below expected range {roc_range}")
-                self.assertLessEqual(roc, roc_range[1], f"ROC {roc} above expected range {roc_range}")
-                
-                self.assertGreaterEqual(fuel, fuel_range[0], f"Fuel {fuel} below expected range {fuel_range}")
-                self.assertLessEqual(fuel, fuel_range[1], f"Fuel {fuel} above expected range {fuel_range}")
-                
-                print(f"✓ {altitude}ft, {weight}lbs: IAS={ias}, ROC={roc}, Fuel={fuel}")
+        logger.debug("=== Testing Interpolation Between Grid Points ===")
+        
+        altitudes = np.array([altitude for altitude, _, _ in _INTERP_CASES])
+        weights = np.array([weight for _, weight, _ in _INTERP_CASES])
+        ranges = [expected for _, _, expected in _INTERP_CASES]
+        ias, roc, fuel = self.calc.get_performance_standard_batch(altitudes, weights)
+        
+        # Check that interpolated values are within expected ranges
+        for values, metric, name in [(ias, "ias", "IAS"), (roc, "roc", "ROC"), (fuel, "fuel", "Fuel")]:
+            low = np.array([getattr(expected, f"{metric}_lo") for expected in ranges])
+            high = np.array([getattr(expected, f"{metric}_hi") for expected in ranges])
+            self.assertTrue(bool(((low <= values) & (values <= high)).all()),
+                f"{name} {values} outside expected ranges {list(zip(low, high))}")
+        
+        # The scalar kernel blends all three metrics with the same weights as the batch path
+        scalar = np.array([self.calc.get_performance_standard(altitude, weight)
+                           for altitude, weight in zip(altitudes, weights)])
+        np.testing.assert_allclose(scalar, np.stack([ias, roc, fuel], axis=-1), atol=1e-6)
+        
+        logger.debug(f"✓ {altitudes.tolist()}ft, {weights.tolist()}lbs: IAS={ias}, ROC={roc}, Fuel={fuel}")
     
     def test_temperature_correction_isa_conditions(self):
         """Test temperature correction at ISA standard conditions"""
-        print("\n=== Testing Temperature Correction (ISA) ===")
+        logger.debug("=== Testing Temperature Correction (ISA) ===")
+        
+        altitudes, isa_temps = (np.array(column) for column in zip(*_ISA_CASES))
+        
+        batch = self.calc.get_performance_batch(altitudes, 2000, isa_temps)
+        self.assertTrue(batch.valid.all(), f"Failed to get performance at ISA conditions: valid={batch.valid}")
         
         # At ISA conditions, density altitude should equal pressure altitude
-        test_cases = [
-            (0, 15),      # Sea level ISA: 15°C
-            (5000, 5),    # 5000ft ISA: 5°C  
-            (10000, -5),  # 10000ft ISA: -5°C
-            (15000, -15), # 15000ft ISA: -15°C
-        ]
-        
-        for altitude, isa_temp in test_cases:
-            with self.subTest(altitude=altitude, temperature=isa_temp):
-                perf = self.calc.get_performance_with_temperature(altitude, 2000, isa_temp)
-                self.assertIsNotNone(perf, f"Failed to get performance at {altitude}ft, {isa_temp}°C")
-                
-                # At ISA conditions, density altitude should equal pressure altitude
-                self.assertAlmostEqual(perf.density_altitude_ft, altitude, places=0,
-                    msg=f"Density altitude should equal pressure altitude at ISA conditions")
-                self.assertAlmostEqual(perf.isa_deviation_c, 0, places=1,
-                    msg=f"ISA deviation should be zero at ISA conditions")
-                self.assertAlmostEqual(perf.performance_factor, 1.0, places=2,
-                    msg=f"Performance factor should be 1.0 at ISA conditions")
-                
-                print(f"✓ {altitude}ft, {isa_temp}°C: DA={perf.density_altitude_ft}ft, deviation={perf.isa_deviation_c}°C")
+        np.testing.assert_allclose(batch.density_altitude_ft, altitudes, atol=0.5,
+            err_msg="Density altitude should equal pressure altitude at ISA conditions")
+        np.testing.assert_allclose(self.calc.calculate_density_altitude(altitudes, isa_temps), altitudes, atol=0.5,
+            err_msg="Density altitude should equal pressure altitude at ISA conditions")
+        np.testing.assert_allclose(batch.isa_deviation_c, 0, atol=0.05,
+            err_msg="ISA deviation should be zero at ISA conditions")
+        np.testing.assert_allclose(batch.performance_factor, 1.0, atol=0.005,
+            err_msg="Performance factor should be 1.0 at ISA conditions")
+        
+        logger.debug(f"✓ ISA conditions {altitudes.tolist()}ft: DA={batch.density_altitude_ft.tolist()}ft")
     
     def test_temperature_effects_hot_cold(self):
         """Test temperature effects on performance"""
-        print("\n=== Testing Temperature Effects ===")
+        logger.debug("=== Testing Temperature Effects ===")
         
-        altitude = 5000
-        weight = 2000
-        
-        # Test hot day (ISA +20°C)
-        hot_temp = 25  # ISA at 5000ft is 5°C, so this is +20°C
-        hot_perf = self.calc.get_performance_with_temperature(altitude, weight, hot_temp)
-        
-        # Test cold day (ISA -10°C)
-        cold_temp = -5  # ISA at 5000ft is 5°C, so this is -10°C  
-        cold_perf = self.calc.get_performance_with_temperature(altitude, weight, cold_temp)
-        
-        self.assertIsNotNone(hot_perf, "Failed to get hot day performance")
-        self.assertIsNotNone(cold_perf, "Failed to get cold day performance")
-        
-        # Hot day should have worse performance (lower ROC)
-        self.assertLess(hot_perf.roc_fpm, cold_perf.roc_fpm,
-            "Hot day should have lower rate of climb than cold day")
-        
-        # Hot day should have higher density altitude
-        self.assertGreater(hot_perf.density_altitude_ft, cold_perf.density_altitude_ft,
-            "Hot day should have higher density altitude than cold day")
-        
-        # Performance factors should reflect temperature impact
-        self.assertLess(hot_perf.performance_factor, 1.0, "Hot day should reduce performance")
-        self.assertGreater(cold_perf.performance_factor, 1.0, "Cold day should improve performance")
-        
-        print(f"✓ Hot day ({hot_temp}°C): ROC={hot_perf.roc_fpm}fpm, DA={hot_perf.density_altitude_ft}ft")
-        print(f"✓ Cold day ({cold_temp}°C): ROC={cold_perf.roc_fpm}fpm, DA={cold_perf.density_altitude_ft}ft")
+        for altitude, weight, hot_temp, cold_temp in _TEMP_EFFECT_CASES:
+            with self.subTest(altitude=altitude, weight=weight):
+                hot_perf = self.calc.get_performance_with_temperature(altitude, weight, hot_temp)
+                cold_perf = self.calc.get_performance_with_temperature(altitude, weight, cold_temp)
+                
+                self.assertIsNotNone(hot_perf, "Failed to get hot day performance")
+                self.assertIsNotNone(cold_perf, "Failed to get cold day performance")
+                
+                # Hot day should have worse performance (lower ROC)
+                self.assertLess(hot_perf.roc_fpm, cold_perf.roc_fpm,
+                    "Hot day should have lower rate of climb than cold day")
+                
+                # Hot day should have higher density altitude
+                self.assertGreater(hot_perf.density_altitude_ft, cold_perf.density_altitude_ft,
+                    "Hot day should have higher density altitude than cold day")
+                
+                # Performance factors should reflect temperature impact
+                self.assertLess(hot_perf.performance_factor, 1.0, "Hot day should reduce performance")
+                self.assertGreater(cold_perf.performance_factor, 1.0, "Cold day should improve performance")
+                
+                logger.debug(f"✓ Hot day ({hot_temp}°C): ROC={hot_perf.roc_fpm}fpm, DA={hot_perf.density_altitude_ft}ft")
+                logger.debug(f"✓ Cold day ({cold_temp}°C): ROC={cold_perf.roc_fpm}fpm, DA={cold_perf.density_altitude_ft}ft")
     
     def test_climb_segment_with_lapse_rate(self):
         """Test climb segment calculation with proper temperature lapse rate"""
-        print("\n=== Testing Climb Segment with Lapse Rate ===")
+        logger.debug("=== Testing Climb Segment with Lapse Rate ===")
         
         # Test sea level to 10000ft climb
         segment = self.calc.get_climb_segment_performance(0, 10000, 2000, 15)
@@ -168,90 +225,233 @@ class TestAircraftPerformance(unittest.TestCase):
         self.assertGreater(segment.start_ias_mph, segment.end_ias_mph,
             "IAS should decrease with altitude")
         
-        print(f"✓ Segment 0→10000ft: ROC={segment.avg_roc_fpm}fpm, Time={segment.climb_time_min}min, Fuel={segment.segment_fuel_gal}gal")
+        logger.debug(f"✓ Segment 0→10000ft: ROC={segment.avg_roc_fpm}fpm, Time={segment.climb_time_min}min, Fuel={segment.segment_fuel_gal}gal")
         
         # Test that segment fuel matches the difference between start and end fuel
-        start_perf = self.calc.get_performance_with_temperature(0, 2000, 15)
-        end_perf = self.calc.get_performance_with_temperature(10000, 2000, -5)  # 15°C - 20°C = -5°C at 10000ft
+        self.assertEqual(segment.start_perf.temperature_c, 15)
+        self.assertEqual(segment.end_perf.temperature_c, -5)  # 15°C - 20°C = -5°C at 10000ft
+        
+        expected_segment_fuel = segment.end_perf.fuel_gal - segment.start_perf.fuel_gal
+        self.assertTrue(isclose(segment.segment_fuel_gal, expected_segment_fuel, abs_tol=0.05),
+            f"Segment fuel should equal difference: got {segment.segment_fuel_gal}, expected {expected_segment_fuel}")
+    
+    @unittest.skipIf(HAVE_NUMBA, "lookups are only memoized when running without numba")
+    def test_repeated_lookups_are_cached(self):
+        """Test that repeated temperature-corrected lookups are served from the cache"""
+        logger.debug("=== Testing Lookup Cache ===")
+        
+        first = self.calc.get_performance_tuple(10000, 2000, -5)
+        hits = _bilerp3_cached.cache_info().hits
+        
+        # Interpolation points are quantized to 1 ft / 1 lb before the cache lookup
+        perf = self.calc.get_performance_with_temperature(10000.2, 2000.4, -5)
+        self.assertGreater(_bilerp3_cached.cache_info().hits, hits)
+        self.assertEqual(perf.roc_fpm, first.roc_fpm)
         
-        expected_segment_fuel = end_perf.fuel_gal - start_perf.fuel_gal
-        self.assertAlmostEqual(segment.segment_fuel_gal, expected_segment_fuel, places=1,
-            msg=f"Segment fuel should equal difference: got {segment.segment_fuel_gal}, expected {expected_segment_fuel}")
+        # The returned record still describes the requested conditions
+        self.assertEqual(perf.pressure_altitude_ft, 10000.2)
+        self.assertEqual(perf.temperature_c, -5)
+        self.assertEqual(perf.density_altitude_ft, self.calc.calculate_density_altitude(10000.2, -5))
+        
+        logger.debug(f"✓ Cached lookup at 10000ft, -5°C: ROC={first.roc_fpm:.1f}fpm")
+    
+    def test_performance_batch_matches_scalar(self):
+        """Test that batched performance matches the scalar API point by point"""
+        logger.debug("=== Testing Batched Performance ===")
+        
+        altitudes = np.array([0, 2500, 5000, 7500, 15000, 20000])
+        weights = np.array([1700, 1850, 2000, 2300, 2150, 2000])
+        temperatures = np.array([15, 20, -5, 0, -15, -25])
+        
+        batch = self.calc.get_performance_batch(altitudes, weights, temperatures)
+        self.assertIsInstance(batch, PerformanceBatch)
+        self.assertEqual(batch.valid.shape, altitudes.shape)
+        
+        # Scalar results for the same points (out-of-bounds points stay NaN)
+        scalar = [self.calc.get_performance_with_temperature(int(altitude), int(weight), int(temp))
+                  for altitude, weight, temp in zip(altitudes, weights, temperatures)]
+        expected = np.array([[perf.ias_mph, perf.roc_fpm, perf.fuel_gal, perf.density_altitude_ft]
+                             if perf is not None else [np.nan] * 4 for perf in scalar])
+        
+        np.testing.assert_array_equal(batch.valid, [perf is not None for perf in scalar])
+        np.testing.assert_allclose(batch.ias_mph, expected[:, 0], atol=0.1)
+        np.testing.assert_allclose(batch.roc_fpm, expected[:, 1], atol=0.1)
+        np.testing.assert_allclose(batch.fuel_gal, expected[:, 2], atol=0.01)
+        np.testing.assert_allclose(batch.density_altitude_ft[batch.valid], expected[batch.valid, 3], atol=1)
+        
+        # Out-of-bounds points still report their atmospheric conditions
+        self.assertFalse(batch.valid[-1])
+        self.assertTrue(np.isnan(batch.performance_factor[-1]))
+        self.assertEqual(batch.pressure_altitude_ft[-1], 20000)
+        self.assertEqual(batch.density_altitude_ft[-1], self.calc.calculate_density_altitude(20000.0, -25.0))
+        
+        # Off-grid conditions agree beyond rounding (the scalar lookup is only quantized without numba)
+        scalar_perf = self.calc.get_performance_tuple(7321.7, 2143.3, 3.7)
+        single = self.calc.get_performance_batch(7321.7, 2143.3, 3.7)
+        np.testing.assert_allclose([scalar_perf.roc_fpm, scalar_perf.density_altitude_ft],
+                                   [single.roc_fpm, single.density_altitude_ft],
+                                   atol=1e-6 if HAVE_NUMBA else 0.5)
+        
+        # Batches compare by identity rather than elementwise, and are hashable
+        self.assertNotEqual(batch, self.calc.get_performance_batch(altitudes, weights, temperatures))
+        self.assertIsInstance(hash(batch), int)
+        
+        rows = batch.to_tuples()
+        self.assertEqual(len(rows), int(batch.valid.sum()))
+        self.assertIsInstance(rows[0], PerfTuple)
+        self.assertEqual(rows[0].roc_fpm, batch.roc_fpm[0])
+        
+        logger.debug(f"✓ Batch of {len(altitudes)} points: {int(batch.valid.sum())} valid")
+        
+        # Scalar inputs give 0-d arrays in every field
+        single = self.calc.get_performance_batch(5000, 2000, 5)
+        for name in PerfTuple._fields:
+            self.assertEqual(getattr(single, name).shape, (), f"{name} should be 0-d")
+        self.assertEqual(single.to_tuples(), [self.calc.get_performance_tuple(5000, 2000, 5)])
+    
+    def test_nan_inputs_are_out_of_bounds(self):
+        """Test that NaN inputs are reported as out of bounds rather than raising"""
+        logger.debug("=== Testing NaN Inputs ===")
+        
+        nan = float('nan')
+        
+        # Small batches run the NumPy kernel, large ones the parallel kernel (when installed)
+        for size in (2, 2048):
+            with self.subTest(size=size):
+                altitudes = np.full(size, 5000.0)
+                altitudes[0] = nan
+                batch = self.calc.get_performance_batch(altitudes, 2000, 5)
+                self.assertFalse(batch.valid[0])
+                self.assertTrue(batch.valid[1:].all())
+                self.assertTrue(np.isnan(batch.roc_fpm[0]))
+        
+        ias, roc, fuel = self.calc.get_performance_standard_batch([nan, 5000], [2000, nan])
+        self.assertTrue(np.isnan(roc).all())
+        
+        for altitude, weight in [(nan, 2000), (5000, nan)]:
+            with self.subTest(altitude=altitude, weight=weight):
+                with self.assertRaisesRegex(ValueError, "outside the data grid"):
+                    self.calc.get_performance_standard(altitude, weight)
+        
+        self.assertIsNone(self.calc.get_performance_with_temperature(5000, 2000, nan))
+        self.assertIsNone(self.calc.get_climb_segment_performance(0, 5000, 2000, nan))
+        self.assertFalse(self.calc.get_climb_profile([0, 5000, 10000], 2000, nan)['valid'].any())
+        
+        logger.debug("✓ NaN inputs are out of bounds")
+    
+    def test_large_performance_batch(self):
+        """Test a sweep large enough to use the parallel batch kernel"""
+        logger.debug("=== Testing Large Performance Batch ===")
+        
+        altitudes, weights = np.meshgrid(np.linspace(0, 15000, 64), np.linspace(1700, 2300, 32), indexing='ij')
+        batch = self.calc.get_performance_batch(altitudes, weights, 15 - 2 * altitudes / 1000)
+        self.assertEqual(batch.roc_fpm.shape, altitudes.shape)
+        self.assertTrue(batch.valid.all())
+        
+        # Spot-check against the scalar API
+        idx = (np.array([0, 21, 40, 63]), np.array([0, 5, 31, 17]))
+        expected = np.array([self.calc.get_performance_standard(altitude, weight)
+                             for altitude, weight in zip(altitudes[idx], weights[idx])])
+        got = np.stack([batch.ias_mph[idx], batch.roc_fpm[idx], batch.fuel_gal[idx]], axis=-1)
+        np.testing.assert_allclose(got, expected, atol=1e-3)
+        
+        logger.debug(f"✓ Batch of {altitudes.size} ISA points")
+    
+    def test_climb_profile_matches_segments(self):
+        """Test that a vectorized climb profile matches segment-by-segment calculation"""
+        logger.debug("=== Testing Climb Profile ===")
+        
+        breaks = [0, 5000, 10000, 12500]
+        profile = self.calc.get_climb_profile(breaks, 2000, 15)
+        self.assertEqual(profile.dtype, SEGMENT_DTYPE)
+        self.assertEqual(len(profile), len(breaks) - 1)
+        self.assertTrue(profile['valid'].all())
+        
+        segments = [self.calc.get_climb_segment_performance(start_alt, end_alt, 2000, 15 - 2.0 * start_alt / 1000)
+                    for start_alt, end_alt in zip(breaks[:-1], breaks[1:])]
+        np.testing.assert_array_equal(profile['altitude_gain_ft'], [seg.altitude_gain_ft for seg in segments])
+        np.testing.assert_allclose(profile['avg_roc_fpm'], [seg.avg_roc_fpm for seg in segments], atol=0.1)
+        np.testing.assert_allclose(profile['segment_fuel_gal'], [seg.segment_fuel_gal for seg in segments], atol=0.01)
+        np.testing.assert_allclose(profile['climb_time_min'], [seg.climb_time_min for seg in segments], atol=0.1)
+        
+        # Hot day pushes the upper segments above the data range
+        hot_profile = self.calc.get_climb_profile(breaks, 2000, 40)
+        self.assertFalse(hot_profile['valid'][-1])
+        self.assertTrue(np.isnan(hot_profile['avg_roc_fpm'][-1]))
+        
+        # Fewer than two breaks make no segments
+        for short_breaks in ([], [5000]):
+            self.assertEqual(self.calc.get_climb_profile(short_breaks, 2000, 15).shape, (0,))
+        
+        logger.debug(f"✓ Profile {breaks}: ROC={profile['avg_roc_fpm'].round(1).tolist()}fpm")
     
     def test_density_altitude_calculation(self):
         """Test density altitude calculations"""
-        print("\n=== Testing Density Altitude Calculation ===")
-        
-        test_cases = [
-            # (pressure_alt, temp, expected_approx_density_alt)
-            (0, 15, 0),        # ISA at sea level
-            (0, 25, 1200),     # Hot day at sea level (ISA +10°C)
-            (0, 5, -1200),     # Cold day at sea level (ISA -10°C)  
-            (5000, 5, 5000),   # ISA at 5000ft
-            (5000, 25, 7400),  # Hot day at 5000ft (ISA +20°C)
-        ]
-        
-        for pressure_alt, temp, expected_da in test_cases:
-            with self.subTest(pressure_alt=pressure_alt, temp=temp):
-                da = self.calc.calculate_density_altitude(pressure_alt, temp)
-                
-                # Allow 10% tolerance for approximation formula
-                tolerance = abs(expected_da * 0.1) if expected_da != 0 else 200
-                self.assertAlmostEqual(da, expected_da, delta=tolerance,
-                    msg=f"Density altitude mismatch: got {da}, expected ~{expected_da}")
-                
-                print(f"✓ {pressure_alt}ft, {temp}°C → DA={da:.0f}ft (expected ~{expected_da})")
+        logger.debug("=== Testing Density Altitude Calculation ===")
+        
+        pressure_alt, temp, expected_da = (np.array(column) for column in zip(*_DA_CASES))
+        da = self.calc.calculate_density_altitude(pressure_alt, temp)
+        
+        # Allow 10% tolerance for approximation formula
+        tolerance = np.where(expected_da != 0, np.abs(expected_da * 0.1), 200)
+        self.assertTrue(bool((np.abs(da - expected_da) <= tolerance).all()),
+            f"Density altitude mismatch: got {da}, expected ~{expected_da}")
+        
+        logger.debug(f"✓ DA={da.round().tolist()}ft (expected ~{expected_da.tolist()})")
     
     def test_boundary_conditions(self):
         """Test boundary conditions and error handling"""
-        print("\n=== Testing Boundary Conditions ===")
+        logger.debug("=== Testing Boundary Conditions ===")
         
         # Test at exact data boundaries - should work
-        boundary_cases = [
-            (0, 1700), (0, 2300),           # Min/max weight at min altitude
-            (15000, 1700), (15000, 2300),   # Min/max weight at max altitude
-        ]
-        
-        for alt, weight in boundary_cases:
+        for alt, weight in _BOUNDARY_CASES:
             with self.subTest(altitude=alt, weight=weight):
+                self.assertTrue(self.calc.is_in_bounds(alt, weight))
                 ias, roc, fuel = self.calc.get_performance_standard(alt, weight)
                 self.assertGreater(ias, 0, "IAS should be positive")
                 self.assertGreater(roc, 0, "ROC should be positive")
                 self.assertGreater(fuel, 0, "Fuel should be positive")
-                print(f"✓ Boundary case {alt}ft, {weight}lbs: IAS={ias}, ROC={roc}, Fuel={fuel}")
+                logger.debug(f"✓ Boundary case {alt}ft, {weight}lbs: IAS={ias}, ROC={roc}, Fuel={fuel}")
         
-        # Test outside data bounds - should return None
-        out_of_bounds_cases = [
-            (-1000, 2000),  # Below altitude range
-            (20000, 2000),  # Above altitude range  
-            (5000, 1500),   # Below weight range
-            (5000, 2500),   # Above weight range
-        ]
-        
-        for alt, weight in out_of_bounds_cases:
+        # Test outside data bounds - should be reported by is_in_bounds and rejected with ValueError
+        for alt, weight in _OUT_OF_BOUNDS_CASES:
             with self.subTest(altitude=alt, weight=weight):
-                try:
-                    ias, roc, fuel = self.calc.get_performance_standard(alt, weight)
-                    self.fail(f"Expected ValueError for out-of-bounds case {alt}ft, {weight}lbs")
-                except ValueError:
-                    print(f"✓ Correctly rejected out-of-bounds case {alt}ft, {weight}lbs")
+                self.assertFalse(self.calc.is_in_bounds(alt, weight))
+                with self.assertRaises(ValueError, msg=f"Expected ValueError for out-of-bounds case {alt}ft, {weight}lbs"):
+                    self.calc.get_performance_standard(alt, weight)
+                logger.debug(f"✓ Correctly rejected out-of-bounds case {alt}ft, {weight}lbs")
+        
+        # Conditions just outside the data are rejected even where they round onto the grid
+        self.assertIsNone(self.calc.get_performance_with_temperature(5000, 1699.6, 5))
+        self.assertIsNone(self.calc.get_performance_with_temperature(15000.4, 2000, -15))
+    
+    def test_default_calculator_is_shared(self):
+        """Test that get_default_calculator returns one shared instance"""
+        logger.debug("=== Testing Default Calculator ===")
+        
+        calc = get_default_calculator()
+        self.assertIsInstance(calc, AircraftPerformance)
+        self.assertIs(get_default_calculator(), calc)
+        logger.debug("✓ Default calculator is shared")
     
     def test_data_bounds_object(self):
         """Test DataBounds object"""
-        print("\n=== Testing Data Bounds ===")
+        logger.debug("=== Testing Data Bounds ===")
         
         bounds = self.calc.get_data_bounds()
         self.assertIsInstance(bounds, DataBounds)
         self.assertEqual(bounds.altitude_range_ft, (0, 15000))
         self.assertEqual(bounds.weight_range_lbs, (1700, 2300))
-        print(f"✓ Data bounds: Alt={bounds.altitude_range_ft}, Weight={bounds.weight_range_lbs}")
+        logger.debug(f"✓ Data bounds: Alt={bounds.altitude_range_ft}, Weight={bounds.weight_range_lbs}")
     
     def test_performance_data_object(self):
         """Test PerformanceData object structure"""
-        print("\n=== Testing PerformanceData Object ===")
+        logger.debug("=== Testing PerformanceData Object ===")
         
         perf = self.calc.get_performance_with_temperature(5000, 2000, 20)
         self.assertIsInstance(perf, PerformanceData)
+        self.assertEqual(tuple(self.calc.get_performance_tuple(5000, 2000, 20)),
+                         tuple(getattr(perf, name) for name in PerfTuple._fields))
         
         # Check all required attributes exist and have reasonable values
         self.assertGreater(perf.ias_mph, 0)
@@ -264,11 +464,17 @@ class TestAircraftPerformance(unittest.TestCase):
         self.assertIsInstance(perf.isa_deviation_c, float)
         self.assertIsInstance(perf.performance_factor, float)
         
-        print(f"✓ PerformanceData object: IAS={perf.ias_mph}, ROC={perf.roc_fpm}, Fuel={perf.fuel_gal}")
+        # Rounding happens only when presenting the values
+        display = perf.as_display_dict()
+        self.assertEqual(display['roc_fpm'], round(perf.roc_fpm, 1))
+        self.assertEqual(display['performance_factor'], round(perf.performance_factor, 3))
+        self.assertIn(f"performance_factor={display['performance_factor']}", str(perf))
+        
+        logger.debug(f"✓ PerformanceData object: IAS={perf.ias_mph}, ROC={perf.roc_fpm}, Fuel={perf.fuel_gal}")
         
     def test_climb_segment_object(self):
         """Test ClimbSegment object structure"""
-        print("\n=== Testing ClimbSegment Object ===")
+        logger.debug("=== Testing ClimbSegment Object ===")
         
         segment = self.calc.get_climb_segment_performance(2000, 8000, 2100, 18)
         self.assertIsInstance(segment, ClimbSegment)
@@ -282,59 +488,97 @@ class TestAircraftPerformance(unittest.TestCase):
         self.assertGreater(segment.climb_time_min, 0)
         self.assertGreater(segment.start_ias_mph, 0)
         self.assertGreater(segment.end_ias_mph, 0)
+        self.assertIsInstance(segment.start_perf, PerformanceData)
+        self.assertIsInstance(segment.end_perf, PerformanceData)
+        self.assertEqual(segment.end_perf.pressure_altitude_ft, 8000)
         
-        print(f"✓ ClimbSegment object: {segment.start_altitude_ft}→{segment.end_altitude_ft}ft, ROC={segment.avg_roc_fpm}fpm")
+        logger.debug(f"✓ ClimbSegment object: {segment.start_altitude_ft}→{segment.end_altitude_ft}ft, ROC={segment.avg_roc_fpm}fpm")
 
 
 class TestDataIntegrity(unittest.TestCase):
     """Test the integrity of hardcoded data"""
     
+    # Every (altitude, weight) grid point that each table must cover, taken from the POH
+    # data rather than from the module's own grid
+    EXPECTED_KEYS = frozenset(POH_IAS)
+    
+    # Dense (weight, altitude) views of the tables for vectorized checks
+    IAS_BY_WEIGHT = IAS_ARR.T
+    ROC_BY_WEIGHT = ROC_ARR.T
+    FUEL_BY_WEIGHT = FUEL_ARR.T
+    
     def test_data_completeness(self):
         """Test that all data tables have complete coverage"""
-        print("\n=== Testing Data Completeness ===")
+        logger.debug("=== Testing Data Completeness ===")
+        
+        for data, name in [(IAS_DATA, "IAS"), (ROC_DATA, "ROC"), (FUEL_DATA, "Fuel")]:
+            missing = self.EXPECTED_KEYS - data.keys()
+            self.assertFalse(missing, f"Missing {name} data for {sorted(missing)}")
         
-        for altitude in ALTITUDES:
-            for weight in WEIGHTS:
-                with self.subTest(altitude=altitude, weight=weight):
-                    key = (altitude, weight)
-                    self.assertIn(key, IAS_DATA, f"Missing IAS data for {key}")
-                    self.assertIn(key, ROC_DATA, f"Missing ROC data for {key}")
-                    self.assertIn(key, FUEL_DATA, f"Missing Fuel data for {key}")
+        logger.debug(f"✓ Complete data coverage: {len(ALTITUDES)} altitudes × {len(WEIGHTS)} weights = {len(ALTITUDES) * len(WEIGHTS)} data points")
+    
+    def test_tables_match_poh(self):
+        """Test that the array and dict tables hold the published POH values"""
+        logger.debug("=== Testing Tables Against POH ===")
+        
+        for array, data, poh, name in [(IAS_ARR, IAS_DATA, POH_IAS, "IAS"), (ROC_ARR, ROC_DATA, POH_ROC, "ROC"),
+                                       (FUEL_ARR, FUEL_DATA, POH_FUEL, "Fuel")]:
+            self.assertEqual(array.shape, (len(ALTITUDES), len(WEIGHTS)))
+            self.assertEqual(data, poh, f"{name} dict mismatch")
+            i = np.searchsorted(ALTITUDES, [altitude for altitude, _ in poh])
+            j = np.searchsorted(WEIGHTS, [weight for _, weight in poh])
+            np.testing.assert_array_equal(array[i, j], list(poh.values()), err_msg=f"{name} array mismatch")
+        
+        logger.debug("✓ Tables match the POH data")
+    
+    def test_tables_are_read_only(self):
+        """Test that the tables cannot be modified behind the compiled kernels' backs"""
+        logger.debug("=== Testing Read-Only Tables ===")
+        
+        for array, name in [(IAS_ARR, "IAS"), (ROC_ARR, "ROC"), (FUEL_ARR, "Fuel")]:
+            with self.subTest(table=name), self.assertRaises(ValueError):
+                array[1, 1] = 0
         
-        print(f"✓ Complete data coverage: {len(ALTITUDES)} altitudes × {len(WEIGHTS)} weights = {len(ALTITUDES) * len(WEIGHTS)} data points")
+        logger.debug("✓ Tables are read-only")
     
     def test_data_consistency(self):
         """Test that data values are reasonable and consistent"""
-        print("\n=== Testing Data Consistency ===")
+        logger.debug("=== Testing Data Consistency ===")
+        
+        # Differences between consecutive altitudes, one row per weight
+        ias_diffs = np.diff(self.IAS_BY_WEIGHT, axis=1)
+        roc_diffs = np.diff(self.ROC_BY_WEIGHT, axis=1)
+        fuel_diffs = np.diff(self.FUEL_BY_WEIGHT, axis=1)
         
         # IAS should generally decrease with altitude (for same weight)
-        for weight in WEIGHTS:
-            prev_ias = float('inf')
-            for altitude in ALTITUDES:
-                ias = IAS_DATA[(altitude, weight)]
-                self.assertLessEqual(ias, prev_ias + 2, f"IAS should generally decrease with altitude (weight {weight})")
-                prev_ias = ias
+        self.assertTrue(bool((ias_diffs <= 2).all()), f"IAS should generally decrease with altitude:\n{ias_diffs}")
         
         # ROC should decrease with altitude (for same weight)
-        for weight in WEIGHTS:
-            prev_roc = float('inf')
-            for altitude in ALTITUDES:
-                roc = ROC_DATA[(altitude, weight)]
-                self.assertLess(roc, prev_roc, f"ROC should decrease with altitude (weight {weight})")
-                prev_roc = roc
-        
-        # Fuel should increase with altitude (for same weight)
-        for weight in WEIGHTS:
-            prev_fuel = 0
-            for altitude in ALTITUDES:
-                fuel = FUEL_DATA[(altitude, weight)]
-                self.assertGreaterEqual(fuel, prev_fuel, f"Fuel should increase with altitude (weight {weight})")
-                prev_fuel = fuel
-        
-        print("✓ Data consistency checks passed")
+        self.assertTrue(bool((roc_diffs < 0).all()), f"ROC should decrease with altitude:\n{roc_diffs}")
+        
+        # Fuel should be non-negative and increase with altitude (for same weight)
+        self.assertTrue(bool((self.FUEL_BY_WEIGHT[:, 0] >= 0).all()), "Fuel should be non-negative")
+        self.assertTrue(bool((fuel_diffs >= 0).all()), f"Fuel should increase with altitude:\n{fuel_diffs}")
+        
+        logger.debug("✓ Data consistency checks passed")
+
+
+def load_tests(loader, tests, pattern):
+    """Run tests in declaration order, so tests sharing cached lookups run back to back"""
+    suite = unittest.TestSuite()
+    cases = [obj for obj in globals().values()
+             if isinstance(obj, type) and issubclass(obj, unittest.TestCase) and obj.__module__ == __name__]
+    for case in cases:
+        declared = list(vars(case))
+        names = sorted(loader.getTestCaseNames(case), key=declared.index)
+        suite.addTests(case(name) for name in names)
+    return suite
 
 
 if __name__ == '__main__':
+    if os.environ.get('VERBOSE_TESTS'):
+        logging.basicConfig(format='%(message)s')
+    
     # Run tests with verbose output
-    unittest.main(verbosity=2, buffer=True)
+    unittest.main(verbosity=2)
 